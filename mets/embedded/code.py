@@ -13,6 +13,7 @@ from os import getenv
 import time
 import board
 import microcontroller
+from micropython import const
 from digitalio import DigitalInOut, Direction, Pull
 from adafruit_matrixportal.network import Network
 from adafruit_matrixportal.matrix import Matrix
@@ -30,11 +31,14 @@ if None in [ssid, password]:
     )
 
 # Mets team ID in MLB API
-METS_TEAM_ID = 121
+METS_TEAM_ID = const(121)
 
 # Get today's date for the API call
 import rtc
 
+# Last formatted date, only recomputed when the day rolls over
+_date_cache = {"day": None, "str": None}
+
 def get_today_date():
     """Get today's date in YYYY-MM-DD format"""
     try:
@@ -43,7 +47,11 @@ def get_today_date():
         year = current_time.tm_year
         month = current_time.tm_mon
         day = current_time.tm_mday
+        if (year, month, day) == _date_cache["day"]:
+            return _date_cache["str"]
         date_str = f"{year:04d}-{month:02d}-{day:02d}"
+        _date_cache["day"] = (year, month, day)
+        _date_cache["str"] = date_str
         print(f"Using RTC date: {date_str}")
         return date_str
     except Exception as e:
@@ -52,13 +60,18 @@ def get_today_date():
         print(f"RTC failed ({e}), using fallback date: {fallback_date}")
         return fallback_date
 
-# Set up API endpoint for MLB schedule
+# Set up API endpoint for MLB schedule, rebuilt only when the date changes
+_url_cache = {"date": None, "url": None}
+
 def get_data_source():
     date = get_today_date()
-    return f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date}"
+    if date != _url_cache["date"]:
+        _url_cache["date"] = date
+        _url_cache["url"] = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date}"
+    return _url_cache["url"]
 
 DATA_LOCATION = ["dates", 0, "games"]
-UPDATE_INTERVAL = 300  # Update every 5 minutes (300 seconds)
+UPDATE_INTERVAL = const(300)  # Update every 5 minutes (300 seconds)
 
 # --- Display setup ---
 matrix = Matrix()
@@ -181,5 +194,8 @@ while True:
             gfx.display_game(error_game)
             continue
 
-    # Small delay to prevent overwhelming the system
-    time.sleep(1)
+    # Sleep until the next scheduled refresh (at least 1 second)
+    now = time.monotonic()
+    next_time = localtime_refresh + 3600 if localtime_refresh else now
+    next_game = game_refresh + UPDATE_INTERVAL if game_refresh else now
+    time.sleep(max(1, min(next_time, next_game) - now))
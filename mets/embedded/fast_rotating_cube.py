@@ -2,23 +2,59 @@
 #
 # SPDX-License-Identifier: MIT
 
+import array
+import math
 import time
+import bitmaptools
 import displayio
+from micropython import const
 from adafruit_matrixportal.matrixportal import MatrixPortal
 from os import getenv
 
-# Matrix dimensions
+# Matrix dimensions (read from settings.toml at runtime, so these can't be const())
 MATRIX_WIDTH = int(getenv("MATRIX_WIDTH", "64"))
 MATRIX_HEIGHT = int(getenv("MATRIX_HEIGHT", "64"))
 
-# Pre-computed sine/cosine lookup table (scaled by 1000 for integer math)
-SINE_TABLE = []
-COSINE_TABLE = []
-for i in range(360):
-    import math
-    angle = i * math.pi / 180
-    SINE_TABLE.append(int(math.sin(angle) * 1000))
-    COSINE_TABLE.append(int(math.cos(angle) * 1000))
+# Pre-computed first-quadrant sine table, 0-90 degrees (scaled by 1000 for integer math)
+# Values never exceed 1000, so they are packed as 16-bit signed ints
+_D2R = math.pi / 180
+SINE_QUADRANT = array.array("h", (int(math.sin(i * _D2R) * 1000) for i in range(91)))
+
+def _sin(angle):
+    """Integer sine (scaled by 1000) of an angle in degrees, reflected from the quadrant table"""
+    angle %= 360
+    if angle <= 90:
+        return SINE_QUADRANT[angle]
+    elif angle <= 180:
+        return SINE_QUADRANT[180 - angle]
+    elif angle <= 270:
+        return -SINE_QUADRANT[angle - 180]
+    else:
+        return -SINE_QUADRANT[360 - angle]
+
+def _cos(angle):
+    """Integer cosine (scaled by 1000) of an angle in degrees"""
+    return _sin(angle + 90)
+
+# Cohen-Sutherland outcodes, used to skip lines that are entirely off-screen
+_INSIDE = const(0)
+_LEFT = const(1)
+_RIGHT = const(2)
+_TOP = const(4)
+_BOTTOM = const(8)
+
+def _outcode(x, y, width, height):
+    """Compute the Cohen-Sutherland region code of a point"""
+    code = _INSIDE
+    if x < 0:
+        code |= _LEFT
+    elif x >= width:
+        code |= _RIGHT
+    if y < 0:
+        code |= _TOP
+    elif y >= height:
+        code |= _BOTTOM
+    return code
 
 class FastRotatingCube:
     def __init__(self):
@@ -60,33 +96,34 @@ class FastRotatingCube:
         # Show the display
         self.matrixportal.display.root_group = self.main_group
         
-        # Define cube vertices (scaled by 1000 for integer math)
-        self.vertices = [
-            [-1000, -1000, -1000],  # 0: Back bottom left
-            [1000, -1000, -1000],   # 1: Back bottom right
-            [1000, 1000, -1000],    # 2: Back top right
-            [-1000, 1000, -1000],   # 3: Back top left
-            [-1000, -1000, 1000],   # 4: Front bottom left
-            [1000, -1000, 1000],    # 5: Front bottom right
-            [1000, 1000, 1000],     # 6: Front top right
-            [-1000, 1000, 1000]     # 7: Front top left
-        ]
-        
-        # Define cube edges (which vertices are connected)
-        self.edges = [
+        # Define cube vertices as separate X/Y/Z arrays (scaled by 1000 for integer math)
+        # 0: Back bottom left, 1: Back bottom right, 2: Back top right, 3: Back top left
+        # 4: Front bottom left, 5: Front bottom right, 6: Front top right, 7: Front top left
+        self.vx = array.array("i", [-1000, 1000, 1000, -1000, -1000, 1000, 1000, -1000])
+        self.vy = array.array("i", [-1000, -1000, 1000, 1000, -1000, -1000, 1000, 1000])
+        self.vz = array.array("i", [-1000, -1000, -1000, -1000, 1000, 1000, 1000, 1000])
+        
+        # Define cube edges as flat vertex index pairs (which vertices are connected)
+        self.edges = array.array("B", [
             # Back face
-            [0, 1], [1, 2], [2, 3], [3, 0],
+            0, 1, 1, 2, 2, 3, 3, 0,
             # Front face
-            [4, 5], [5, 6], [6, 7], [7, 4],
+            4, 5, 5, 6, 6, 7, 7, 4,
             # Connecting edges
-            [0, 4], [1, 5], [2, 6], [3, 7]
-        ]
+            0, 4, 1, 5, 2, 6, 3, 7
+        ])
+        
+        # Color per edge: Red=back face, Green=front face, Blue=connecting edges
+        self.edge_colors = array.array("B", [1] * 4 + [2] * 4 + [3] * 4)
         
         # Rotation angles (in degrees for lookup table)
         self.angle_x = 0
         self.angle_y = 0
         self.angle_z = 0
         
+        # Combined rotation matrix, rebuilt once per frame
+        self.update_rotation_matrix()
+        
         # Animation speed (degrees per frame)
         self.rotation_speed = 3
         
@@ -97,11 +134,16 @@ class FastRotatingCube:
         self.center_x = (MATRIX_WIDTH * 1000) // 2
         self.center_y = (MATRIX_HEIGHT * 1000) // 2
         
-        # Previous frame pixels to track changes
-        self.previous_pixels = set()
+        # Framebuffer (one byte per pixel, row-major) pushed to the bitmap once per frame
+        self.fb = bytearray(MATRIX_WIDTH * MATRIX_HEIGHT)
+        self.fbv = memoryview(self.fb)
         
-        # Pre-allocate arrays for transformed vertices
-        self.transformed_vertices = [[0, 0] for _ in range(8)]
+        # Zeroed buffer used to wipe the framebuffer in a single slice assignment
+        self.blank = bytes(MATRIX_WIDTH * MATRIX_HEIGHT)
+        
+        # Pre-allocate arrays for transformed (screen) vertices
+        self.tx = array.array("i", [0] * 8)
+        self.ty = array.array("i", [0] * 8)
     
     def set_brightness(self, brightness):
         """Set display brightness (0.0 = off, 1.0 = full brightness)"""
@@ -111,55 +153,36 @@ class FastRotatingCube:
     def create_dimmed_palette(self, dim_factor=0.3):
         """Create a dimmed color palette (alternative to display brightness)"""
         # Dim factor: 0.0 = black, 1.0 = full brightness
-        self.palette[0] = 0x000000  # Black (unchanged)
-        self.palette[1] = int(0xFF * dim_factor) << 16  # Dimmed Red
-        self.palette[2] = int(0xFF * dim_factor) << 8   # Dimmed Green
-        self.palette[3] = int(0xFF * dim_factor)        # Dimmed Blue
-        self.palette[4] = (int(0xFF * dim_factor) << 16) | (int(0xFF * dim_factor) << 8)  # Dimmed Yellow
-        self.palette[5] = (int(0xFF * dim_factor) << 16) | int(0xFF * dim_factor)         # Dimmed Magenta
-        self.palette[6] = (int(0xFF * dim_factor) << 8) | int(0xFF * dim_factor)          # Dimmed Cyan
-        self.palette[7] = (int(0xFF * dim_factor) << 16) | (int(0xFF * dim_factor) << 8) | int(0xFF * dim_factor)  # Dimmed White
+        d = int(0xFF * dim_factor)
+        colors = (
+            0x000000,                   # Black (unchanged)
+            d << 16,                    # Dimmed Red
+            d << 8,                     # Dimmed Green
+            d,                          # Dimmed Blue
+            (d << 16) | (d << 8),       # Dimmed Yellow
+            (d << 16) | d,              # Dimmed Magenta
+            (d << 8) | d,               # Dimmed Cyan
+            (d << 16) | (d << 8) | d,   # Dimmed White
+        )
+        for i, color in enumerate(colors):
+            self.palette[i] = color
         print(f"Palette dimmed to {dim_factor * 100:.0f}% brightness")
     
-    def fast_clear(self, pixels_to_clear):
-        """Clear only specific pixels instead of entire display"""
-        for x, y in pixels_to_clear:
-            if 0 <= x < MATRIX_WIDTH and 0 <= y < MATRIX_HEIGHT:
-                self.bitmap[x, y] = 0
-    
     def set_pixel(self, x, y, color_index):
         """Set a single pixel to a specific color"""
         if 0 <= x < MATRIX_WIDTH and 0 <= y < MATRIX_HEIGHT:
             self.bitmap[x, y] = color_index
     
-    def fast_rotate_point(self, point):
-        """Fast integer-based rotation using lookup tables"""
-        x, y, z = point
+    def fast_rotate_point(self, x, y, z, matrix):
+        """Fast integer-based rotation using the precomputed rotation matrix"""
+        m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix
+        
+        # Matrix entries are scaled by 1000000, point coordinates by 1000
+        new_x = (m00 * x + m01 * y + m02 * z) // 1000000
+        new_y = (m10 * x + m11 * y + m12 * z) // 1000000
+        new_z = (m20 * x + m21 * y + m22 * z) // 1000000
         
-        # Get sine and cosine values from lookup tables
-        sin_x = SINE_TABLE[self.angle_x % 360]
-        cos_x = COSINE_TABLE[self.angle_x % 360]
-        sin_y = SINE_TABLE[self.angle_y % 360]
-        cos_y = COSINE_TABLE[self.angle_y % 360]
-        sin_z = SINE_TABLE[self.angle_z % 360]
-        cos_z = COSINE_TABLE[self.angle_z % 360]
-        
-        # Rotate around X-axis
-        new_y = (y * cos_x - z * sin_x) // 1000
-        new_z = (y * sin_x + z * cos_x) // 1000
-        y, z = new_y, new_z
-        
-        # Rotate around Y-axis
-        new_x = (x * cos_y + z * sin_y) // 1000
-        new_z = (-x * sin_y + z * cos_y) // 1000
-        x, z = new_x, new_z
-        
-        # Rotate around Z-axis
-        new_x = (x * cos_z - y * sin_z) // 1000
-        new_y = (x * sin_z + y * cos_z) // 1000
-        x, y = new_x, new_y
-        
-        return [x, y, z]
+        return [new_x, new_y, new_z]
     
     def fast_project_to_2d(self, point):
         """Fast integer-based 2D projection"""
@@ -171,21 +194,33 @@ class FastRotatingCube:
         
         return screen_x, screen_y
     
-    def fast_draw_line(self, x1, y1, x2, y2, color_index, current_pixels):
-        """Fast line drawing with pixel tracking"""
+    def fast_draw_line(self, x1, y1, x2, y2, color_index):
+        """Fast line drawing into the framebuffer"""
+        # Bind globals/attributes used in the loop to locals
+        width = MATRIX_WIDTH
+        height = MATRIX_HEIGHT
+        fbv = self.fbv
+        
+        # Skip lines wholly off one side; only lines that cross an edge pay for
+        # a per-pixel bounds test, so every on-screen pixel is still drawn
+        code1 = _outcode(x1, y1, width, height)
+        code2 = _outcode(x2, y2, width, height)
+        if code1 & code2:
+            return
+        inside = not (code1 | code2)
+        
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
         
-        x_step = 1 if x1 < x2 else -1
-        y_step = 1 if y1 < y2 else -1
+        x_step = (x2 > x1) - (x2 < x1)
+        y_step = (y2 > y1) - (y2 < y1)
         
         error = dx - dy
         x, y = x1, y1
         
         while True:
-            if 0 <= x < MATRIX_WIDTH and 0 <= y < MATRIX_HEIGHT:
-                self.bitmap[x, y] = color_index
-                current_pixels.add((x, y))
+            if inside or (0 <= x < width and 0 <= y < height):
+                fbv[y * width + x] = color_index
             
             if x == x2 and y == y2:
                 break
@@ -202,72 +237,83 @@ class FastRotatingCube:
     
     def fast_draw_cube(self):
         """Fast cube drawing with optimized pixel updates"""
-        # Track current frame pixels
-        current_pixels = set()
+        # Erase the previous frame from the framebuffer
+        self.fbv[:] = self.blank
         
-        # Transform all vertices with pre-allocated array
-        for i, vertex in enumerate(self.vertices):
-            rotated = self.fast_rotate_point(vertex)
-            self.transformed_vertices[i] = self.fast_project_to_2d(rotated)
+        # Transform all vertices into the pre-allocated arrays
+        matrix = self.rotation_matrix
+        vx, vy, vz = self.vx, self.vy, self.vz
+        tx, ty = self.tx, self.ty
+        for i in range(len(vx)):
+            rotated = self.fast_rotate_point(vx[i], vy[i], vz[i], matrix)
+            tx[i], ty[i] = self.fast_project_to_2d(rotated)
         
         # Draw all edges
-        for edge in self.edges:
-            start_vertex = self.transformed_vertices[edge[0]]
-            end_vertex = self.transformed_vertices[edge[1]]
-            
-            # Use different colors for different types of edges
-            if edge in [[0, 1], [1, 2], [2, 3], [3, 0]]:  # Back face
-                color = 1  # Red
-            elif edge in [[4, 5], [5, 6], [6, 7], [7, 4]]:  # Front face
-                color = 2  # Green
-            else:  # Connecting edges
-                color = 3  # Blue
-            
-            self.fast_draw_line(
-                start_vertex[0], start_vertex[1],
-                end_vertex[0], end_vertex[1],
-                color, current_pixels
-            )
-        
-        # Clear only pixels from previous frame that aren't used in current frame
-        pixels_to_clear = self.previous_pixels - current_pixels
-        self.fast_clear(pixels_to_clear)
-        
-        # Update previous pixels for next frame
-        self.previous_pixels = current_pixels
+        edges = self.edges
+        edge_colors = self.edge_colors
+        for i in range(len(edge_colors)):
+            start = edges[2 * i]
+            end = edges[2 * i + 1]
+            self.fast_draw_line(tx[start], ty[start], tx[end], ty[end], edge_colors[i])
+        
+        # Push the whole framebuffer to the bitmap in a single C-level copy
+        bitmaptools.arrayblit(self.bitmap, self.fb)
     
     def update_rotation(self):
         """Update rotation angles for animation"""
         self.angle_x = (self.angle_x + self.rotation_speed) % 360
         self.angle_y = (self.angle_y + int(self.rotation_speed * 0.7)) % 360
         self.angle_z = (self.angle_z + int(self.rotation_speed * 0.5)) % 360
+        self.update_rotation_matrix()
+    
+    def update_rotation_matrix(self):
+        """Combine the X, Y and Z rotations into one matrix (Rz * Ry * Rx)"""
+        # Angles are already kept in [0, 360) by update_rotation
+        angle_x, angle_y, angle_z = self.angle_x, self.angle_y, self.angle_z
+        
+        # Get sine and cosine values from the lookup table (scaled by 1000)
+        sin_x = _sin(angle_x)
+        cos_x = _cos(angle_x)
+        sin_y = _sin(angle_y)
+        cos_y = _cos(angle_y)
+        sin_z = _sin(angle_z)
+        cos_z = _cos(angle_z)
+        
+        # Entries are scaled by 1000000; triple products are brought back down by 1000
+        self.rotation_matrix = (
+            cos_z * cos_y,
+            cos_z * sin_y * sin_x // 1000 - sin_z * cos_x,
+            cos_z * sin_y * cos_x // 1000 + sin_z * sin_x,
+            sin_z * cos_y,
+            sin_z * sin_y * sin_x // 1000 + cos_z * cos_x,
+            sin_z * sin_y * cos_x // 1000 - cos_z * sin_x,
+            -sin_y * 1000,
+            cos_y * sin_x,
+            cos_y * cos_x,
+        )
     
     def run_animation(self, duration=None):
         """Run the fast rotating cube animation"""
         print("Starting FAST rotating cube animation...")
         print(f"Matrix size: {MATRIX_WIDTH}x{MATRIX_HEIGHT}")
-        print("Optimizations: Integer math, lookup tables, differential updates")
+        print("Optimizations: Integer math, lookup tables, single framebuffer blit")
         print("Colors: Red=back face, Green=front face, Blue=connecting edges")
         print(f"Display brightness: {self.matrixportal.display.brightness}")
         print("Press Ctrl+C to stop")
         
         # Initial clear
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                self.bitmap[x, y] = 0
-        
-        start_time = time.time()
+        self.bitmap.fill(0)
+        
+        # Frame timing in nanoseconds; the clock is read once per frame
+        frame_ns = 16000000  # Try to maintain ~60 FPS
+        duration_ns = int(duration * 1000000000) if duration else 0
+        start_ns = time.monotonic_ns()
+        next_frame_ns = start_ns + frame_ns
+        last_fps_ns = start_ns
         frame_count = 0
-        last_fps_time = start_time
         
         try:
             while True:
-                frame_start = time.monotonic()
-                
-                # Check if we should stop (if duration is specified)
-                if duration and time.time() - start_time >= duration:
-                    break
-                
                 # Draw the current frame
                 self.fast_draw_cube()
                 
@@ -275,28 +321,33 @@ class FastRotatingCube:
                 self.update_rotation()
                 
                 frame_count += 1
+                now = time.monotonic_ns()
+                
+                # Check if we should stop (if duration is specified)
+                if duration_ns and now - start_ns >= duration_ns:
+                    break
                 
                 # Print FPS every 2 seconds
-                current_time = time.time()
-                if current_time - last_fps_time >= 2.0:
-                    elapsed = current_time - last_fps_time
-                    fps = (frame_count - (frame_count - int(elapsed * 60))) / elapsed
+                elapsed_ns = now - last_fps_ns
+                if elapsed_ns >= 2000000000:
+                    fps = frame_count * 1000000000 / elapsed_ns
                     print(f"FPS: {fps:.1f}")
-                    last_fps_time = current_time
+                    last_fps_ns = now
+                    frame_count = 0
                 
-                # Very minimal delay for maximum speed
-                frame_time = time.monotonic() - frame_start
-                if frame_time < 0.016:  # Try to maintain ~60 FPS
-                    time.sleep(0.016 - frame_time)
+                # Sleep until the next frame is due; if we fell behind, don't try to catch up
+                if now < next_frame_ns:
+                    time.sleep((next_frame_ns - now) / 1000000000)
+                    next_frame_ns += frame_ns
+                else:
+                    next_frame_ns = now + frame_ns
         
         except KeyboardInterrupt:
             print("\nAnimation stopped by user")
         
         finally:
             # Clear display when done
-            for y in range(MATRIX_HEIGHT):
-                for x in range(MATRIX_WIDTH):
-                    self.bitmap[x, y] = 0
+            self.bitmap.fill(0)
             print("Animation complete!")
 
 # Run the animation
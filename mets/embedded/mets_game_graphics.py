@@ -4,18 +4,19 @@
 
 import time
 import displayio
+from micropython import const
 from adafruit_display_text.label import Label
 from adafruit_bitmap_font import bitmap_font
 from os import getenv
 
 # Colors for different elements
-METS_BLUE = 0x002D72
-METS_ORANGE = 0xFF5910
-SCORE_COLOR = 0xFFFFFF
-TEAM_COLOR = 0x00D3FF
-STATUS_COLOR = 0x9000FF
-INNING_COLOR = 0xCCCCCC
-ERROR_COLOR = 0xFF0000
+METS_BLUE = const(0x002D72)
+METS_ORANGE = const(0xFF5910)
+SCORE_COLOR = const(0xFFFFFF)
+TEAM_COLOR = const(0x00D3FF)
+STATUS_COLOR = const(0x9000FF)
+INNING_COLOR = const(0xCCCCCC)
+ERROR_COLOR = const(0xFF0000)
 
 MATRIX_WIDTH = int(getenv("MATRIX_WIDTH"))
 MATRIX_HEIGHT = int(getenv("MATRIX_HEIGHT"))
@@ -24,8 +25,46 @@ MATRIX_HEIGHT = int(getenv("MATRIX_HEIGHT"))
 cwd = ("/" + __file__).rsplit("/", 1)[0]
 
 logo_spritesheet = cwd + "/logo.bmp"
-logo_width = 32
-logo_height = 32
+logo_width = const(32)
+logo_height = const(32)
+
+# Score position and maximum length (e.g. "10-10")
+SCORE_X = const(20)
+SCORE_CHARS = const(5)
+
+# Dictionary of team name abbreviations
+TEAM_ABBREVS = {
+    "New York Yankees": "NYY",
+    "Boston Red Sox": "BOS",
+    "Tampa Bay Rays": "TB",
+    "Baltimore Orioles": "BAL",
+    "Toronto Blue Jays": "TOR",
+    "Chicago White Sox": "CWS",
+    "Cleveland Guardians": "CLE",
+    "Detroit Tigers": "DET",
+    "Kansas City Royals": "KC",
+    "Minnesota Twins": "MIN",
+    "Houston Astros": "HOU",
+    "Los Angeles Angels": "LAA",
+    "Oakland Athletics": "OAK",
+    "Seattle Mariners": "SEA",
+    "Texas Rangers": "TEX",
+    "Atlanta Braves": "ATL",
+    "Miami Marlins": "MIA",
+    "Philadelphia Phillies": "PHI",
+    "Washington Nationals": "WSH",
+    "Chicago Cubs": "CHC",
+    "Cincinnati Reds": "CIN",
+    "Milwaukee Brewers": "MIL",
+    "Pittsburgh Pirates": "PIT",
+    "St. Louis Cardinals": "STL",
+    "Arizona Diamondbacks": "ARI",
+    "Colorado Rockies": "COL",
+    "Los Angeles Dodgers": "LAD",
+    "San Diego Padres": "SD",
+    "San Francisco Giants": "SF",
+    "New York Mets": "NYM"
+}
 
 class MetsGameGraphics(displayio.Group):
     def __init__(self, display):
@@ -60,11 +99,15 @@ class MetsGameGraphics(displayio.Group):
             self.small_font = displayio.FONT
             self.medium_font = displayio.FONT
         
-        # Pre-load common glyphs
+        # Pre-load only the glyphs each font actually renders; anything else is loaded on demand
         if hasattr(self.small_font, 'load_glyphs'):
-            glyphs = b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-,.: "
-            self.small_font.load_glyphs(glyphs)
-            self.medium_font.load_glyphs(glyphs)
+            # Team abbreviations, status/inning text and "vs"/"@"
+            self.small_font.load_glyphs(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZadegilmnoprstvy@-.: ")
+            # Score only
+            self.medium_font.load_glyphs(b"0123456789-")
+        
+        # Last game data shown, used to skip redundant refreshes
+        self._last_game = None
         
         # Initialize logo
         self._load_logo()
@@ -102,10 +145,16 @@ class MetsGameGraphics(displayio.Group):
     def _create_text_labels(self):
         """Create text labels for game information"""
         # Score display - positioned to the right of the logo
-        self.score_label = Label(self.medium_font, text="0-0", color=SCORE_COLOR)
-        self.score_label.x = 20  # Moved left from 24
-        self.score_label.y = 8
-        self._score_group.append(self.score_label)
+        # One label per character so a refresh only re-renders the characters that changed
+        self.score_chars = []
+        for _ in range(SCORE_CHARS):
+            char_label = Label(self.medium_font, text="", color=SCORE_COLOR)
+            char_label.x = SCORE_X
+            char_label.y = 8
+            self._score_group.append(char_label)
+            self.score_chars.append(char_label)
+        self._score_text = ""
+        self._set_score_text("0-0")
         
         # Team matchup display
         self.teams_label = Label(self.small_font, text="vs TBD", color=TEAM_COLOR)
@@ -119,15 +168,44 @@ class MetsGameGraphics(displayio.Group):
         self.status_label.y = 28
         self._info_group.append(self.status_label)
     
+    def _set_score_text(self, text):
+        """Update the score, re-rendering only the characters that changed"""
+        if text == self._score_text:
+            return
+        x = SCORE_X
+        for i, char_label in enumerate(self.score_chars):
+            char = text[i] if i < len(text) else ""
+            if char != char_label.text:
+                char_label.text = char
+            # Lay characters out by glyph advance, as a single label would
+            char_label.x = x
+            if char:
+                x += self.medium_font.get_glyph(ord(char)).shift_x
+        self._score_text = text
+    
     def _show_loading(self):
         """Show loading state"""
-        self.score_label.text = "..."
+        self._set_score_text("...")
         self.teams_label.text = "Loading"
         self.status_label.text = "Getting data..."
         self.display.root_group = self.root_group
     
     def display_game(self, game_data):
         """Display game information on the matrix"""
+        # Skip the refresh entirely if nothing has changed since the last one
+        game_key = (
+            game_data.get("home_score"),
+            game_data.get("away_score"),
+            game_data.get("status"),
+            game_data.get("inning"),
+            game_data.get("is_mets_home"),
+            game_data.get("home_team"),
+            game_data.get("away_team"),
+        )
+        if game_key == self._last_game:
+            print("Game data unchanged, skipping display update")
+            return
+        
         try:
             print(f"Displaying game: {game_data}")
             
@@ -148,8 +226,9 @@ class MetsGameGraphics(displayio.Group):
                 # Mets are away team
                 score_text = f"{home_score}-{away_score}"
                 
-            print(f"Setting score text to: '{score_text}'")
-            self.score_label.text = score_text
+            if score_text != self._score_text:
+                print(f"Setting score text to: '{score_text}'")
+                self._set_score_text(score_text)
             
             # Update team matchup
             opponent = game_data["away_team"] if game_data["is_mets_home"] else game_data["home_team"]
@@ -157,8 +236,9 @@ class MetsGameGraphics(displayio.Group):
             opponent_short = self._shorten_team_name(opponent)
             home_away = "vs" if game_data["is_mets_home"] else "@"
             teams_text = f"{home_away} {opponent_short}"
-            print(f"Setting teams text to: '{teams_text}'")
-            self.teams_label.text = teams_text
+            if teams_text != self.teams_label.text:
+                print(f"Setting teams text to: '{teams_text}'")
+                self.teams_label.text = teams_text
             
             # Update status
             status = game_data["status"]
@@ -166,36 +246,41 @@ class MetsGameGraphics(displayio.Group):
             
             if status == "Final":
                 status_text = "Final"
-                self.status_label.color = METS_ORANGE
+                status_color = METS_ORANGE
             elif status in ["In Progress", "Delayed"]:
                 if inning:
                     status_text = inning
                 else:
                     status_text = "Live"
-                self.status_label.color = METS_ORANGE
+                status_color = METS_ORANGE
             elif status in ["Scheduled", "Warmup", "Pre-Game"]:
                 status_text = "Today"
-                self.status_label.color = STATUS_COLOR
+                status_color = STATUS_COLOR
             elif status == "No Game":
                 status_text = "No Game"
-                self.status_label.color = INNING_COLOR
+                status_color = INNING_COLOR
             elif status == "Error":
                 status_text = "Error"
-                self.status_label.color = ERROR_COLOR
+                status_color = ERROR_COLOR
             else:
                 status_text = status[:9]  # Truncate long status
-                self.status_label.color = STATUS_COLOR
+                status_color = STATUS_COLOR
             
-            print(f"Setting status text to: '{status_text}'")
-            self.status_label.text = status_text
+            if status_color != self.status_label.color:
+                self.status_label.color = status_color
+            if status_text != self.status_label.text:
+                print(f"Setting status text to: '{status_text}'")
+                self.status_label.text = status_text
             
             # Update the display
             self.display.root_group = self.root_group
+            self._last_game = game_key
             
         except Exception as e:
             print(f"Error displaying game: {e}")
+            self._last_game = None
             # Show error state
-            self.score_label.text = "ERR"
+            self._set_score_text("ERR")
             self.teams_label.text = "Error"
             self.status_label.text = "Display Error"
             self.status_label.color = ERROR_COLOR
@@ -203,38 +288,4 @@ class MetsGameGraphics(displayio.Group):
     
     def _shorten_team_name(self, team_name):
         """Shorten team names for display on small screen"""
-        # Dictionary of team name abbreviations
-        team_abbrevs = {
-            "New York Yankees": "NYY",
-            "Boston Red Sox": "BOS",
-            "Tampa Bay Rays": "TB",
-            "Baltimore Orioles": "BAL",
-            "Toronto Blue Jays": "TOR",
-            "Chicago White Sox": "CWS",
-            "Cleveland Guardians": "CLE",
-            "Detroit Tigers": "DET",
-            "Kansas City Royals": "KC",
-            "Minnesota Twins": "MIN",
-            "Houston Astros": "HOU",
-            "Los Angeles Angels": "LAA",
-            "Oakland Athletics": "OAK",
-            "Seattle Mariners": "SEA",
-            "Texas Rangers": "TEX",
-            "Atlanta Braves": "ATL",
-            "Miami Marlins": "MIA",
-            "Philadelphia Phillies": "PHI",
-            "Washington Nationals": "WSH",
-            "Chicago Cubs": "CHC",
-            "Cincinnati Reds": "CIN",
-            "Milwaukee Brewers": "MIL",
-            "Pittsburgh Pirates": "PIT",
-            "St. Louis Cardinals": "STL",
-            "Arizona Diamondbacks": "ARI",
-            "Colorado Rockies": "COL",
-            "Los Angeles Dodgers": "LAD",
-            "San Diego Padres": "SD",
-            "San Francisco Giants": "SF",
-            "New York Mets": "NYM"
-        }
-        
-        return team_abbrevs.get(team_name, team_name[:3].upper()) 
\ No newline at end of file
+        return TEAM_ABBREVS.get(team_name, team_name[:3].upper())
\ No newline at end of file
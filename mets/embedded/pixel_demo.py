@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import time
+import bitmaptools
 import displayio
 import board
 import terminalio
@@ -12,8 +13,48 @@ from adafruit_bitmap_font import bitmap_font
 from os import getenv
 
 # Matrix dimensions (adjust these to match your actual matrix)
-MATRIX_WIDTH = getenv("MATRIX_WIDTH")
-MATRIX_HEIGHT = getenv("MATRIX_HEIGHT")
+MATRIX_WIDTH = int(getenv("MATRIX_WIDTH", "64"))
+MATRIX_HEIGHT = int(getenv("MATRIX_HEIGHT", "32"))
+
+# Coordinate label text and positions, fixed once the matrix size is known
+_SHOW_NUMBERS = MATRIX_WIDTH >= 32 and MATRIX_HEIGHT >= 16
+_TR_TEXT = f"{MATRIX_WIDTH-1},0"
+_BL_TEXT = f"0,{MATRIX_HEIGHT-1}"
+_BR_TEXT = f"{MATRIX_WIDTH-1},{MATRIX_HEIGHT-1}"
+_TR_X = MATRIX_WIDTH - 20
+_BR_X = MATRIX_WIDTH - 30
+_BOTTOM_Y = MATRIX_HEIGHT - 2
+
+def _fill_grid(buf, width, height):
+    """Write the coordinate grid pattern into a row-major byte buffer"""
+    i = 0
+    for y in range(height):
+        # Row-invariant tests, computed once per row instead of once per pixel
+        # (& masks stand in for the power-of-two moduli)
+        border_row = y == 0
+        grid_row = not (y & 7)
+        line_row = not (y & 3)
+        y2 = y * 2
+        for x in range(width):
+            # Create a pattern based on x and y coordinates
+            if border_row or x == 0:
+                # Border in bright white
+                color_index = 255
+            elif grid_row and not (x & 7):
+                # Grid points in bright red
+                color_index = 31
+            elif not (x & 3):
+                # Vertical lines in blue
+                color_index = 95
+            elif line_row:
+                # Horizontal lines in green
+                color_index = 63
+            else:
+                # Fill with a pattern based on position
+                color_index = (x + y2) & 127
+            
+            buf[i] = color_index
+            i += 1
 
 class PixelDemo:
     def __init__(self):
@@ -42,72 +83,62 @@ class PixelDemo:
         self.main_group = displayio.Group()
         self.main_group.append(self.tile_grid)
         
-        # Show the display
+        # Font for the coordinate labels, parsed once
+        self._font = bitmap_font.load_font("fonts/Roboto-Medium-7pt.bdf")
+        
+        # Text overlay, reused by every coordinate_numbers call
+        self._text_group = displayio.Group()
+        self.main_group.append(self._text_group)
+        
+        # Show the display; frames are pushed explicitly with refresh() once each demo is drawn
+        self.matrixportal.display.auto_refresh = False
         self.matrixportal.display.root_group = self.main_group
     
     def _create_palette(self):
         """Create a color palette for the demo"""
-        # Fill palette with various colors
-        for i in range(256):
-            if i < 32:
-                # Red gradient
-                self.palette[i] = (i * 8, 0, 0)
-            elif i < 64:
-                # Green gradient
-                self.palette[i] = (0, (i - 32) * 8, 0)
-            elif i < 96:
-                # Blue gradient
-                self.palette[i] = (0, 0, (i - 64) * 8)
-            elif i < 128:
-                # Yellow gradient
-                self.palette[i] = ((i - 96) * 8, (i - 96) * 8, 0)
-            elif i < 160:
-                # Cyan gradient
-                self.palette[i] = (0, (i - 128) * 8, (i - 128) * 8)
-            elif i < 192:
-                # Magenta gradient
-                self.palette[i] = ((i - 160) * 8, 0, (i - 160) * 8)
-            else:
-                # White gradient
-                self.palette[i] = ((i - 192) * 4, (i - 192) * 4, (i - 192) * 4)
+        # Fill palette with various colors, one 32-entry gradient per segment
+        # (v is stepped by a running add rather than recomputed from i)
+        palette = self.palette
+        v = 0
+        for i in range(32):
+            palette[i] = (v, 0, 0)          # Red gradient
+            palette[32 + i] = (0, v, 0)     # Green gradient
+            palette[64 + i] = (0, 0, v)     # Blue gradient
+            palette[96 + i] = (v, v, 0)     # Yellow gradient
+            palette[128 + i] = (0, v, v)    # Cyan gradient
+            palette[160 + i] = (v, 0, v)    # Magenta gradient
+            v += 8
+        v = 0
+        for i in range(192, 256):
+            palette[i] = (v, v, v)          # White gradient
+            v += 4
+    
+    def clear_display(self):
+        """Clear the display to black"""
+        self.bitmap.fill(0)
     
     def coordinate_grid(self):
         """Display a coordinate grid pattern"""
         print("Displaying coordinate grid...")
         
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                # Create a pattern based on x and y coordinates
-                if x == 0 or y == 0:
-                    # Border in bright white
-                    color_index = 255
-                elif x % 8 == 0 and y % 8 == 0:
-                    # Grid points in bright red
-                    color_index = 31
-                elif x % 4 == 0:
-                    # Vertical lines in blue
-                    color_index = 95
-                elif y % 4 == 0:
-                    # Horizontal lines in green
-                    color_index = 63
-                else:
-                    # Fill with a pattern based on position
-                    color_index = (x + y * 2) % 128
-                
-                self.bitmap[x, y] = color_index
+        # Build the frame in a byte buffer, then copy it to the bitmap in one call
+        buf = bytearray(MATRIX_WIDTH * MATRIX_HEIGHT)
+        _fill_grid(buf, MATRIX_WIDTH, MATRIX_HEIGHT)
+        bitmaptools.arrayblit(self.bitmap, buf)
         
+        self.matrixportal.display.refresh()
         print("Coordinate grid displayed")
     
     def rainbow_gradient(self):
         """Display a rainbow gradient"""
         print("Displaying rainbow gradient...")
         
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                # Create rainbow based on x position
-                hue = (x * 255) // MATRIX_WIDTH
-                self.bitmap[x, y] = hue
+        # Create rainbow based on x position: every row is identical
+        width = MATRIX_WIDTH
+        row = bytes((x * 255) // width for x in range(width))
+        bitmaptools.arrayblit(self.bitmap, row * MATRIX_HEIGHT)
         
+        self.matrixportal.display.refresh()
         print("Rainbow gradient displayed")
     
     def corner_markers(self):
@@ -115,48 +146,38 @@ class PixelDemo:
         print("Displaying corner markers...")
         
         # Clear the display first
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                self.bitmap[x, y] = 0
+        self.clear_display()
+        
+        # Each marker is a solid 5x5 square, filled natively and clamped to the display
+        bitmap = self.bitmap
+        right = max(0, MATRIX_WIDTH - 5)
+        bottom = max(0, MATRIX_HEIGHT - 5)
+        size_x = min(5, MATRIX_WIDTH)
+        size_y = min(5, MATRIX_HEIGHT)
         
         # Top-left corner (RED)
-        for i in range(5):
-            for j in range(5):
-                if i < MATRIX_WIDTH and j < MATRIX_HEIGHT:
-                    self.bitmap[i, j] = 31  # Bright red
+        bitmaptools.fill_region(bitmap, 0, 0, size_x, size_y, 31)  # Bright red
         
         # Top-right corner (GREEN)
-        for i in range(5):
-            for j in range(5):
-                x = MATRIX_WIDTH - 1 - i
-                if x >= 0 and j < MATRIX_HEIGHT:
-                    self.bitmap[x, j] = 63  # Bright green
+        bitmaptools.fill_region(bitmap, right, 0, MATRIX_WIDTH, size_y, 63)  # Bright green
         
         # Bottom-left corner (BLUE)
-        for i in range(5):
-            for j in range(5):
-                y = MATRIX_HEIGHT - 1 - j
-                if i < MATRIX_WIDTH and y >= 0:
-                    self.bitmap[i, y] = 95  # Bright blue
+        bitmaptools.fill_region(bitmap, 0, bottom, size_x, MATRIX_HEIGHT, 95)  # Bright blue
         
         # Bottom-right corner (YELLOW)
-        for i in range(5):
-            for j in range(5):
-                x = MATRIX_WIDTH - 1 - i
-                y = MATRIX_HEIGHT - 1 - j
-                if x >= 0 and y >= 0:
-                    self.bitmap[x, y] = 127  # Bright yellow
+        bitmaptools.fill_region(bitmap, right, bottom, MATRIX_WIDTH, MATRIX_HEIGHT, 127)  # Bright yellow
         
         # Center marker (WHITE)
         center_x = MATRIX_WIDTH // 2
         center_y = MATRIX_HEIGHT // 2
-        for i in range(-2, 3):
-            for j in range(-2, 3):
-                x = center_x + i
-                y = center_y + j
-                if 0 <= x < MATRIX_WIDTH and 0 <= y < MATRIX_HEIGHT:
-                    self.bitmap[x, y] = 255  # Bright white
+        bitmaptools.fill_region(
+            bitmap,
+            max(0, center_x - 2), max(0, center_y - 2),
+            min(MATRIX_WIDTH, center_x + 3), min(MATRIX_HEIGHT, center_y + 3),
+            255  # Bright white
+        )
         
+        self.matrixportal.display.refresh()
         print("Corner markers displayed")
     
     def coordinate_numbers(self):
@@ -164,15 +185,17 @@ class PixelDemo:
         print("Displaying coordinate numbers...")
         
         # Clear the display first
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                self.bitmap[x, y] = 0
+        self.clear_display()
+        
+        # Drop labels left over from a previous call
+        group = self._text_group
+        while len(group):
+            group.pop()
         
         # Add number labels if matrix is large enough
-        if MATRIX_WIDTH >= 32 and MATRIX_HEIGHT >= 16:
+        if _SHOW_NUMBERS:
             # Create text labels for key coordinates
-            group = displayio.Group()
-            font = bitmap_font.load_font("fonts/Roboto-Medium-7pt.bdf")
+            font = self._font
             
             # Top-left (0,0)
             label_00 = Label(font, text="0,0", color=0xFF0000)
@@ -181,26 +204,24 @@ class PixelDemo:
             group.append(label_00)
             
             # Top-right
-            label_tr = Label(font, text=f"{MATRIX_WIDTH-1},0", color=0x00FF00)
-            label_tr.x = MATRIX_WIDTH - 20
+            label_tr = Label(font, text=_TR_TEXT, color=0x00FF00)
+            label_tr.x = _TR_X
             label_tr.y = 6
             group.append(label_tr)
             
             # Bottom-left
-            label_bl = Label(font, text=f"0,{MATRIX_HEIGHT-1}", color=0x0000FF)
+            label_bl = Label(font, text=_BL_TEXT, color=0x0000FF)
             label_bl.x = 1
-            label_bl.y = MATRIX_HEIGHT - 2
+            label_bl.y = _BOTTOM_Y
             group.append(label_bl)
             
             # Bottom-right
-            label_br = Label(font, text=f"{MATRIX_WIDTH-1},{MATRIX_HEIGHT-1}", color=0xFFFF00)
-            label_br.x = MATRIX_WIDTH - 30
-            label_br.y = MATRIX_HEIGHT - 2
+            label_br = Label(font, text=_BR_TEXT, color=0xFFFF00)
+            label_br.x = _BR_X
+            label_br.y = _BOTTOM_Y
             group.append(label_br)
-            
-            # Add the text group
-            self.main_group.append(group)
         
+        self.matrixportal.display.refresh()
         print("Coordinate numbers displayed")
     
     def run_demo(self):
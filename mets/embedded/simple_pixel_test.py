@@ -3,13 +3,14 @@
 # SPDX-License-Identifier: MIT
 
 import time
+import bitmaptools
 import displayio
 from adafruit_matrixportal.matrixportal import MatrixPortal
 from os import getenv
 
 # Matrix dimensions (adjust these to match your actual matrix)
-MATRIX_WIDTH = getenv("MATRIX_WIDTH")
-MATRIX_HEIGHT = getenv("MATRIX_HEIGHT")
+MATRIX_WIDTH = int(getenv("MATRIX_WIDTH", "64"))
+MATRIX_HEIGHT = int(getenv("MATRIX_HEIGHT", "32"))
 
 class SimplePixelTest:
     def __init__(self):
@@ -50,9 +51,7 @@ class SimplePixelTest:
     
     def clear_display(self):
         """Clear the display to black"""
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                self.bitmap[x, y] = 0
+        self.bitmap.fill(0)
     
     def set_pixel(self, x, y, color_index):
         """Set a single pixel to a specific color"""
@@ -61,13 +60,21 @@ class SimplePixelTest:
     
     def draw_line(self, x1, y1, x2, y2, color_index):
         """Draw a simple line between two points"""
-        # Simple line drawing - just for testing
+        # Clamp horizontal/vertical lines to the display once, instead of
+        # bounds-checking every pixel, and skip lines that are entirely off-screen
         if x1 == x2:  # Vertical line
-            for y in range(min(y1, y2), max(y1, y2) + 1):
-                self.set_pixel(x1, y, color_index)
+            if not 0 <= x1 < MATRIX_WIDTH:
+                return
+            y1, y2 = max(0, min(y1, y2)), min(MATRIX_HEIGHT - 1, max(y1, y2))
+            if y1 > y2:
+                return
         elif y1 == y2:  # Horizontal line
-            for x in range(min(x1, x2), max(x1, x2) + 1):
-                self.set_pixel(x, y1, color_index)
+            if not 0 <= y1 < MATRIX_HEIGHT:
+                return
+            x1, x2 = max(0, min(x1, x2)), min(MATRIX_WIDTH - 1, max(x1, x2))
+            if x1 > x2:
+                return
+        bitmaptools.draw_line(self.bitmap, x1, y1, x2, y2, color_index)
     
     def test_corners(self):
         """Test the four corners of the display"""
@@ -143,12 +150,14 @@ class SimplePixelTest:
         print("Testing checkerboard...")
         self.clear_display()
         
-        for y in range(MATRIX_HEIGHT):
-            for x in range(MATRIX_WIDTH):
-                if (x + y) % 2 == 0:
-                    self.set_pixel(x, y, 7)  # White
-                else:
-                    self.set_pixel(x, y, 0)  # Black
+        # Two alternating rows of White (7) / Black (0), stacked into one frame
+        width = MATRIX_WIDTH
+        row_even = bytes(0 if x & 1 else 7 for x in range(width))
+        row_odd = bytes(7 if x & 1 else 0 for x in range(width))
+        frame = (row_even + row_odd) * (MATRIX_HEIGHT // 2)
+        if MATRIX_HEIGHT % 2:
+            frame += row_even
+        bitmaptools.arrayblit(self.bitmap, frame)
         
         print("Checkerboard pattern")
     
@@ -1,48 +1,103 @@
+import functools
+import time
 import requests
-from datetime import datetime
-import pytz
+
+# Prefer a compiled JSON parser when one is installed
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+# Shared session so repeated polls reuse the keep-alive HTTPS connection
+_SESSION = requests.Session()
+
+# Polls within the same window are answered from memory
+CACHE_SECONDS = 30
+
+# New York Mets team ID in MLB API
+METS_TEAM_ID = 121
+
+# API endpoint for MLB schedule
+SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule"
+
+# Only the fields read below; the API drops everything else from the response
+SCHEDULE_FIELDS = "dates,games,status,detailedState,teams,home,away,team,name,id,score"
+
+# Last schedule response, revalidated with its ETag so unchanged data isn't re-sent or re-parsed
+_cache = {"date": None, "etag": None, "data": None}
 
 def get_mets_game_score():
     # Set the date to July 12, 2025
     target_date = "2025-07-12"
     
-    # API endpoint for MLB schedule
-    url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={target_date}"
+    return _get_mets_game_score(target_date, int(time.time() // CACHE_SECONDS))
+
+@functools.lru_cache(maxsize=1)
+def _get_mets_game_score(target_date, time_bucket):
+    # Filter to the Mets server-side so the response holds only their game
+    params = {
+        "sportId": 1,
+        "date": target_date,
+        "teamId": METS_TEAM_ID,
+        "fields": SCHEDULE_FIELDS,
+    }
+    
+    headers = {}
+    if _cache["etag"] and _cache["date"] == target_date:
+        headers["If-None-Match"] = _cache["etag"]
     
     try:
         # Make the API request
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an error for bad status codes
-        data = response.json()
+        response = _SESSION.get(SCHEDULE_URL, params=params, headers=headers, timeout=5)
+    except requests.RequestException as e:
+        return f"Error fetching data: {e}"
+    
+    # Report HTTP error statuses directly rather than raising
+    if not response.ok:
+        return f"API error {response.status_code}"
+    
+    if response.status_code == 304:
+        # Not modified: reuse the previously parsed schedule
+        data = _cache["data"]
+    else:
+        try:
+            data = _json.loads(response.content)
+        except ValueError as e:
+            # A non-JSON body (e.g. a captive portal page) is a failed fetch too
+            return f"Error fetching data: {e}"
+        _cache["date"] = target_date
+        _cache["etag"] = response.headers.get("ETag")
+        _cache["data"] = data
+    
+    # Find the Mets game (an off day comes back with no dates at all)
+    dates = data.get("dates") or ()
+    games = dates[0].get("games", ()) if dates else ()
+    for game in games:
+        home_team = game["teams"]["home"]["team"]["id"]
+        away_team = game["teams"]["away"]["team"]["id"]
         
-        # Find the Mets game
-        mets_team_id = 121  # New York Mets team ID
-        for game in data.get("dates", [{}])[0].get("games", []):
-            home_team = game["teams"]["home"]["team"]["id"]
-            away_team = game["teams"]["away"]["team"]["id"]
+        if home_team == METS_TEAM_ID or away_team == METS_TEAM_ID:
+            # Get game status
+            game_status = game["status"]["detailedState"]
+            home_team_name = game["teams"]["home"]["team"]["name"]
+            away_team_name = game["teams"]["away"]["team"]["name"]
+            home_score = game["teams"]["home"]["score"]
+            away_score = game["teams"]["away"]["score"]
             
-            if home_team == mets_team_id or away_team == mets_team_id:
-                # Get game status
-                game_status = game["status"]["detailedState"]
-                home_team_name = game["teams"]["home"]["team"]["name"]
-                away_team_name = game["teams"]["away"]["team"]["name"]
-                home_score = game["teams"]["home"]["score"]
-                away_score = game["teams"]["away"]["score"]
-                
-                # Check if the game is in progress
-                if game_status in ["In Progress", "Delayed"]:
-                    return f"{away_team_name} {away_score} - {home_team_name} {home_score} (Game in Progress)"
-                elif game_status == "Final":
-                    return f"{away_team_name} {away_score} - {home_team_name} {home_score} (Final)"
-                elif game_status in ["Scheduled", "Warmup", "Pre-Game"]:
-                    return f"No current game score available. Mets game against {away_team_name if home_team == mets_team_id else home_team_name} is {game_status.lower()}."
-                else:
-                    return f"No current game score available. Mets game status: {game_status}."
-        
-        return "No New York Mets game found for July 12, 2025."
+            # Check if the game is in progress
+            if game_status in ["In Progress", "Delayed"]:
+                return f"{away_team_name} {away_score} - {home_team_name} {home_score} (Game in Progress)"
+            elif game_status == "Final":
+                return f"{away_team_name} {away_score} - {home_team_name} {home_score} (Final)"
+            elif game_status in ["Scheduled", "Warmup", "Pre-Game"]:
+                return f"No current game score available. Mets game against {away_team_name if home_team == METS_TEAM_ID else home_team_name} is {game_status.lower()}."
+            else:
+                return f"No current game score available. Mets game status: {game_status}."
     
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching data: {e}"
+    return "No New York Mets game found for July 12, 2025."
 
 if __name__ == "__main__":
     print(get_mets_game_score())
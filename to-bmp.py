@@ -15,6 +15,9 @@ OUTPUT_PATH = os.path.splitext(IMAGE_PATH)[0] + '.bmp'
 # open image
 image = Image.open(IMAGE_PATH)
 
+# let the JPEG decoder downscale by 1/2, 1/4 or 1/8 while decoding (no-op for other formats)
+image.draft('RGB', (LED_MATRIX_WIDTH * 8, LED_MATRIX_HEIGHT * 8))
+
 # get original dimensions
 width, height = image.size
 
@@ -29,7 +32,11 @@ width, height = image.size
 # image = image.crop((left, top, right, bottom))
 
 # resize image to match LED matrix resolution
-image = image.resize((LED_MATRIX_WIDTH, LED_MATRIX_HEIGHT))
+# (reducing_gap does a fast integer box reduce before the final Lanczos pass)
+image = image.resize((LED_MATRIX_WIDTH, LED_MATRIX_HEIGHT), resample=Image.LANCZOS, reducing_gap=3.0)
+
+# quantize to an 8-bit palette so the BMP is 1 byte per pixel
+image = image.convert('RGB').quantize(colors=256, method=Image.Quantize.MEDIANCUT)
 
 # Convert and save as BMP
 image.save(OUTPUT_PATH, format='BMP')